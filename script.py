@@ -11,19 +11,37 @@ This version additionally saves the run's result as a single row in an Excel fil
 
 """
 from zoneinfo import ZoneInfo
-import datetime
+from datetime import datetime
 import asyncio
 import json
 import os
 import random
 import re
+import zipfile
 
+from pathlib import Path
 from urllib.parse import quote_plus
+from xml.sax.saxutils import escape as xml_escape, quoteattr
 from playwright.async_api import async_playwright, TimeoutError
-from bs4 import BeautifulSoup
-from openpyxl.utils import column_index_from_string
+from selectolax.lexbor import LexborHTMLParser
+from openpyxl.utils import column_index_from_string, get_column_letter
 # new imports for Excel writing
-from openpyxl import Workbook, load_workbook
+from openpyxl import load_workbook
+
+# Max number of pages scraped at the same time within one browser context
+MAX_CONCURRENT_PAGES = 4
+
+# Requests aborted for every page: the parsers only read text nodes, never these
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet", "other"}
+BLOCKED_URL_PARTS = ("doubleclick", "google-analytics", "googletagmanager", "adsystem")
+
+# Regexes used on every URL / parsed page, compiled once
+_FN_RE = re.compile(r'[^A-Za-z0-9._-]')
+_SKU_RE = re.compile(r"sku-([A-Za-z0-9-]+)", re.IGNORECASE)
+_SM_RE = re.compile(r"(sm-[A-Za-z0-9-]+)", re.IGNORECASE)
+_PRICE_RE = re.compile(r"\$\s*[\d,]+\.\d{2}")
+# First price on a line that does not mention "was" (i.e. not the struck-through old price)
+_PRICE_NO_WAS_RE = re.compile(r"^(?!.*was).*?(\$[^\S\n]*[\d,]+\.\d{2})", re.IGNORECASE | re.MULTILINE)
 
 # -----------------------
 # Shared helpers
@@ -33,130 +51,223 @@ async def human_delay(min_sec=0.5, max_sec=2.5):
     delay = random.uniform(min_sec, max_sec)
     await asyncio.sleep(delay)
 
-async def human_delay_short():
-    """Small helper to yield control briefly (kept minimal to respect original logic)."""
-    await asyncio.sleep(0.1)
+async def wait_for_selector_or_continue(page, selector, timeout=15000):
+    """Wait until `selector` is in the DOM; on timeout keep going so the page is still saved and parsed."""
+    try:
+        await page.wait_for_selector(selector, state="attached", timeout=timeout)
+    except TimeoutError:
+        print(f"⚠️ '{selector}' not found after {timeout // 1000}s. Continuing anyway...")
+
+async def simulate_human(page):
+    """Wait a random time, then move the mouse and scroll like a person would (stealth mode only)."""
+    # Wait randomly for page content to settle
+    await human_delay(3, 6)
+
+    # 🖱️ Simulate random human-like mouse movement
+    for _ in range(3):
+        x = random.randint(200, 800)
+        y = random.randint(200, 600)
+        await page.mouse.move(x, y, steps=random.randint(5, 15))
+        await human_delay(0.3, 1.5)
+
+    # 🖱️ Random scrolling
+    for _ in range(2):
+        scroll_y = random.randint(400, 1000)
+        await page.mouse.wheel(0, scroll_y)
+        await human_delay(1, 3)
 
 def sanitize_filename(s: str, maxlen: int = 200) -> str:
     """Create a filesystem-safe short filename from a string (URL)."""
     if not s:
         return "file"
     s_enc = quote_plus(s, safe="")
-    s_clean = re.sub(r'[^A-Za-z0-9._-]', '_', s_enc)
+    s_clean = _FN_RE.sub('_', s_enc)
     return s_clean[:maxlen]
 
+def read_html(html_or_path):
+    """Return HTML text: the argument itself if it already is markup, else the file's contents (None if missing)."""
+    if "<" in html_or_path[:200]:
+        return html_or_path
+    if not os.path.exists(html_or_path):
+        return None
+    with open(html_or_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def start_html_save(output_file, html):
+    """Write `html` to `output_file` in a worker thread; await the returned task before relying on the file."""
+    return asyncio.create_task(asyncio.to_thread(Path(output_file).write_text, html, encoding="utf-8"))
+
 def _to_jsonable(v):
     """Convert complex types to JSON strings for Excel storage; leave primitives as-is."""
     if isinstance(v, (dict, list, tuple)):
         return json.dumps(v, ensure_ascii=False)
     return v
 
-def save_dict_to_excel_row(data: dict, excel_path: str = "outputs/results.xlsx"):
+# Excel column letters (of the main sheet) copied, in this order, into the "converted" sheet.
+# "blank" is not a valid column, so those entries become empty spacer columns.
+CONVERTED_COLUMN_REFS = [
+    "blank","a","d","cf","ar","e","cg","as","blank","blank","blank","i","ck","aw","j","cl","ax","blank","blank","blank","n","cp","bb","o","cq","bc","blank","blank","blank","s","cu","bg","t","cv","bh","blank","blank","blank","x","cz","bl","y","da","bm","blank","blank","blank","ac","de","bq","ad","df","br","blank","blank","blank","ah","dj","bv","ai","dk","bw","blank","blank","blank","am","do","ca","an","dp","cb","blank","blank","blank","dt","gb","ex","du","gc","ey","blank","blank","blank","dy","gg","fc","dz","gh","fd","blank","blank","blank","ed","gl","fh","ee","gm","fi","blank","blank","blank","ei","gq","fm","ej","gr","fn","blank","blank","blank","en","gv","fr","eo","gw","fs","blank","blank","blank","es","ha","fw","et","hb","fx"
+]
+
+# Characters XML 1.0 does not allow; they would make the sheet XML unreadable
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+def _xlsx_cell(ref, v):
+    """Return the <c> element for one value (None -> no cell)."""
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return f'<c r="{ref}" t="b"><v>{int(v)}</v></c>'
+    if isinstance(v, (int, float)):
+        return f'<c r="{ref}" t="n"><v>{v!r}</v></c>'
+    text = _ILLEGAL_XML_CHARS_RE.sub("", v if isinstance(v, str) else str(v))
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{xml_escape(text)}</t></is></c>'
+
+def write_values_xlsx(path, sheets):
     """
-    Save the provided dict as a single row in an Excel file.
-    - Keys become column headers (first row).
-    - Values become the next available row.
-    - If the file exists, new keys are appended as new columns; existing column order is preserved.
+    Write a values-only .xlsx by emitting the OOXML parts straight into the zip (no openpyxl objects).
+    - sheets: dict of sheet name -> iterable of rows (lists of values), written in order
+    - Strings are stored inline, numbers/bools as typed values; no styles, formulas or shared strings.
     """
-    os.makedirs(os.path.dirname(excel_path) or ".", exist_ok=True)
-    if not os.path.exists(excel_path):
-        wb = Workbook()
-        ws = wb.active
-        headers = list(data.keys())
-        ws.append(headers)
-        row = [ _to_jsonable(data.get(h)) for h in headers ]
-        ws.append(row)
-        wb.save(excel_path)
-        print(f"✅ Results written to new Excel file: {excel_path}")
-        return
-
-    # file exists - load and append
-    wb = load_workbook(excel_path)
-    ws = wb.active
-
-    # read existing headers from first row
-    first_row = next(ws.iter_rows(min_row=1, max_row=1))
-    existing_headers = [cell.value for cell in first_row]
-
-    # compute headers union preserving existing order and appending new keys at the end
-    new_keys = [k for k in data.keys() if k not in existing_headers]
-    if new_keys:
-        headers = existing_headers + new_keys
-        # rewrite header row with expanded headers
-        for col_idx, header in enumerate(headers, start=1):
-            ws.cell(row=1, column=col_idx, value=header)
-    else:
-        headers = existing_headers
-
-    # build row in header order
-    row = []
-    for h in headers:
-        v = data.get(h)
-        row.append(_to_jsonable(v) if v is not None else None)
-
-    ws.append(row)
-    wb.save(excel_path)
-
-    #making changes from here
-    column_refs = [
-        "blank","a","d","cf","ar","e","cg","as","blank","blank","blank","i","ck","aw","j","cl","ax","blank","blank","blank","n","cp","bb","o","cq","bc","blank","blank","blank","s","cu","bg","t","cv","bh","blank","blank","blank","x","cz","bl","y","da","bm","blank","blank","blank","ac","de","bq","ad","df","br","blank","blank","blank","ah","dj","bv","ai","dk","bw","blank","blank","blank","am","do","ca","an","dp","cb","blank","blank","blank","dt","gb","ex","du","gc","ey","blank","blank","blank","dy","gg","fc","dz","gh","fd","blank","blank","blank","ed","gl","fh","ee","gm","fi","blank","blank","blank","ei","gq","fm","ej","gr","fn","blank","blank","blank","en","gv","fr","eo","gw","fs","blank","blank","blank","es","ha","fw","et","hb","fx"
-    ]
-    new_sheet_base_name="SelectedColumns"
-    source_sheet_name=None
-    # select source sheet
-    if source_sheet_name:
-        if source_sheet_name not in wb.sheetnames:
-            raise ValueError(f"Sheet '{source_sheet_name}' not found in workbook.")
-        src = wb[source_sheet_name]
-    else:
-        src = wb[wb.sheetnames[0]]
-
-    # create unique new sheet name
-    # new_name = new_sheet_base_name
-    new_name = "converted"
-    if new_name in wb.sheetnames:
-        del wb["converted"]
-    # i = 1
-    # while new_name in wb.sheetnames:
-    #     new_name = f"{new_sheet_base_name}_{i}"
-    #     i += 1
-    tgt = wb.create_sheet(title=new_name)
-    # i = 1
-    # while new_name in wb.sheetnames:
-    #     new_name = f"{new_sheet_base_name}_{i}"
-    #     i += 1
-    # tgt = wb.create_sheet(title=new_name)
-
-    max_row = src.max_row if src.max_row is not None else 0
-
-    # target column pointer (1-indexed for openpyxl)
-    tgt_col_idx = 1
-
+    names = list(sheets)
+    col_letters = []
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + "".join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for n in range(1, len(names) + 1)
+            )
+            + '</Types>'
+        ))
+        zf.writestr("_rels/.rels", _XLSX_RELS)
+        zf.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + "".join(
+                f'<sheet name={quoteattr(name)} sheetId="{n}" r:id="rId{n}"/>'
+                for n, name in enumerate(names, start=1)
+            )
+            + '</sheets></workbook>'
+        ))
+        zf.writestr("xl/_rels/workbook.xml.rels", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(
+                f'<Relationship Id="rId{n}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                for n in range(1, len(names) + 1)
+            )
+            + '</Relationships>'
+        ))
+
+        for n, name in enumerate(names, start=1):
+            # stream the sheet XML row by row
+            with zf.open(f"xl/worksheets/sheet{n}.xml", "w") as fh:
+                fh.write(
+                    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                )
+                for r, row in enumerate(sheets[name], start=1):
+                    while len(col_letters) < len(row):
+                        col_letters.append(get_column_letter(len(col_letters) + 1))
+                    cells = "".join(_xlsx_cell(f"{col_letters[c]}{r}", v) for c, v in enumerate(row))
+                    fh.write(f'<row r="{r}">{cells}</row>'.encode("utf-8"))
+                fh.write(b'</sheetData></worksheet>')
+
+def column_plan(column_refs, width):
+    """
+    Resolve column references once into 0-based source column indices.
+    - None -> blank ("blank column"/None), invalid, or past the source's `width` columns, i.e. an empty column
+    """
+    plan = []
     for token in column_refs:
         is_blank = token is None or (isinstance(token, str) and token.strip().lower() == "blank column")
         if is_blank:
-            # leave a blank column (i.e., do nothing but advance tgt_col_idx)
-            tgt_col_idx += 1
+            plan.append(None)
             continue
 
         # try to interpret token as Excel column letters
         col_letters = str(token).strip()
         try:
-            src_col_idx = column_index_from_string(col_letters.upper())
+            idx = column_index_from_string(col_letters.upper()) - 1
         except Exception:
-            # invalid column reference — create an empty column instead
-            for r in range(1, max_row + 1):
-                tgt.cell(row=r, column=tgt_col_idx, value=None)
-            tgt_col_idx += 1
+            plan.append(None)
             continue
+        plan.append(idx if idx < width else None)
+    return plan
+
+def append_result_jsonl(data: dict, jsonl_path: str):
+    """Append one run's flat dict as a single JSON line (cheap, append-only store of all runs)."""
+    os.makedirs(os.path.dirname(jsonl_path) or ".", exist_ok=True)
+    with open(jsonl_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def seed_jsonl_from_xlsx(excel_path: str, jsonl_path: str):
+    """
+    One-time migration: copy the rows of an existing results.xlsx (first sheet) into the JSONL store.
+    - The first row keeps every header (even empty ones) so the column order is preserved.
+    - Later rows only keep non-empty cells.
+    """
+    wb = load_workbook(excel_path, read_only=True)
+    rows = wb.worksheets[0].iter_rows(values_only=True)
+    headers = list(next(rows, ()))
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        for i, values in enumerate(rows):
+            data = {h: v for h, v in zip(headers, values) if h is not None and (i == 0 or v is not None)}
+            f.write(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+    wb.close()
+    print(f"📦 Seeded {jsonl_path} from existing {excel_path}")
+
+def build_xlsx(jsonl_path: str, xlsx_path: str, column_refs=CONVERTED_COLUMN_REFS):
+    """
+    Materialize the JSONL store as an Excel file in one shot.
+    - First sheet: header union of all runs (first-seen order), then one row per run.
+    - "converted" sheet: the first sheet's columns rearranged per column_refs.
+    """
+    headers = {}
+    runs = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            headers.update(dict.fromkeys(data))
+            runs.append(data)
+    headers = list(headers)
+    rows = [headers] + [[_to_jsonable(data.get(h)) for h in headers] for data in runs]
+
+    plan = column_plan(column_refs, width=len(headers))
+    converted = ([row_vals[i] if i is not None else None for i in plan] for row_vals in rows)
+    write_values_xlsx(xlsx_path, {"Sheet": rows, "converted": converted})
+
+def save_dict_to_excel_row(data: dict, excel_path: str = "outputs/results.xlsx"):
+    """
+    Save the provided dict as a single row in an Excel file.
+    - The row is appended to a JSONL store next to the Excel file (e.g. outputs/results.jsonl).
+    - The Excel file is then rebuilt from that store: keys become column headers, one row per run.
+    - New keys are appended as new columns; existing column order is preserved.
+    """
+    jsonl_path = os.path.splitext(excel_path)[0] + ".jsonl"
+    if not os.path.exists(jsonl_path) and os.path.exists(excel_path):
+        seed_jsonl_from_xlsx(excel_path, jsonl_path)
 
-        # Copy values from source column to target column
-        for r in range(1, max_row + 1):
-            src_cell = src.cell(row=r, column=src_col_idx)
-            # copy value only (not style/formula). If formula needed, assign src_cell.value (it will copy the formula text)
-            tgt.cell(row=r, column=tgt_col_idx, value=src_cell.value)
-        tgt_col_idx += 1
-    wb.save(excel_path)
+    append_result_jsonl(data, jsonl_path)
+    build_xlsx(jsonl_path, excel_path)
     print(f"✅ Results appended to Excel file: {excel_path}")
 
 
@@ -197,35 +308,12 @@ def copy_columns_by_references(
     #     i += 1
     tgt = wb.create_sheet(title=new_name)
 
-    max_row = src.max_row if src.max_row is not None else 0
+    plan = column_plan(column_refs, width=src.max_column)
 
-    # target column pointer (1-indexed for openpyxl)
-    tgt_col_idx = 1
-
-    for token in column_refs:
-        is_blank = token is None or (isinstance(token, str) and token.strip().lower() == "blank column")
-        if is_blank:
-            # leave a blank column (i.e., do nothing but advance tgt_col_idx)
-            tgt_col_idx += 1
-            continue
-
-        # try to interpret token as Excel column letters
-        col_letters = str(token).strip()
-        try:
-            src_col_idx = column_index_from_string(col_letters.upper())
-        except Exception:
-            # invalid column reference — create an empty column instead
-            for r in range(1, max_row + 1):
-                tgt.cell(row=r, column=tgt_col_idx, value=None)
-            tgt_col_idx += 1
-            continue
-
-        # Copy values from source column to target column
-        for r in range(1, max_row + 1):
-            src_cell = src.cell(row=r, column=src_col_idx)
-            # copy value only (not style/formula). If formula needed, assign src_cell.value (it will copy the formula text)
-            tgt.cell(row=r, column=tgt_col_idx, value=src_cell.value)
-        tgt_col_idx += 1
+    # Single streaming pass over the source values, one append() per target row
+    for row_vals in src.iter_rows(values_only=True):
+        # copy value only (not style/formula). Formulas come through as their formula text
+        tgt.append([row_vals[i] if i is not None else None for i in plan])
 
     # Save workbook (overwrites existing file)
     wb.save(file_path)
@@ -235,116 +323,28 @@ def copy_columns_by_references(
 # -----------------------
 # AMAZON-specific logic
 # -----------------------
-async def save_amazon_htmls(
-    urls,
-    output_dir="outputs",
-    cookies_file="amazon_cookies.json",
-    headless=True,
-):
-    """Loop over the list of URLs, save each HTML to a unique file, and update cookies once."""
-    os.makedirs(output_dir, exist_ok=True)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless, slow_mo=100)
-
-        # Load existing cookies/session state if available
-        if os.path.exists(cookies_file):
-            print("🍪 Loading existing cookies/session...")
-            context = await browser.new_context(storage_state=cookies_file)
-        else:
-            print("🆕 No cookies found, creating a new session...")
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1366, "height": 768},
-            )
-
-        try:
-            results = []
-            for idx, url in enumerate(urls, start=1):
-                try:
-                    safe_name = sanitize_filename(url)[:120]
-                    output_file = os.path.join(output_dir, f"amazon_{idx}_{safe_name}.html")
-
-                    page = await context.new_page()
-                    print(f"\n[Amazon {idx}/{len(urls)}] Navigating to {url} ...")
-                    await page.goto(url, wait_until="load")
-                    await asyncio.sleep(10)  # Extra wait to ensure dynamic content loads
-
-                    # Wait randomly for page content to settle
-                    await human_delay(3, 6)
-
-                    # 🖱️ Simulate random human-like mouse movement
-                    for _ in range(3):
-                        x = random.randint(200, 800)
-                        y = random.randint(200, 600)
-                        await page.mouse.move(x, y, steps=random.randint(5, 15))
-                        await human_delay(0.3, 1.5)
-
-                    # 🖱️ Random scrolling
-                    for _ in range(2):
-                        scroll_y = random.randint(400, 1000)
-                        await page.mouse.wheel(0, scroll_y)
-                        await human_delay(1, 3)
-
-                    # Extract HTML
-                    html_content = await page.content()
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    print(f"✅ HTML saved to {output_file}")
-
-                    # parse and collect results (keeps your parsing logic)
-                    price, model_number = parse_amazon_html(output_file)
-
-                    await page.close()
-
-                    results.append({"url": url, "file": output_file, "price": price, "model": model_number, "status": "ok"})
-                except Exception as e:
-                    print(f"❌ Error processing URL {url}: {e}")
-                    try:
-                        await page.close()
-                    except Exception:
-                        pass
-                    results.append({"url": url, "file": None, "price": None, "model": None, "status": f"error: {e}"})
-
-            # Save cookies/session state after all pages are processed
-            storage_state = await context.storage_state()
-            with open(cookies_file, "w", encoding="utf-8") as f:
-                json.dump(storage_state, f, ensure_ascii=False, indent=4)
-            print(f"\n🍪 Cookies/session state written to {cookies_file}")
-
-        finally:
-            await browser.close()
-
-    return results
-
-def parse_amazon_html(html_file_path="amazon.html"):
-    # -------- Read HTML --------
-    if not os.path.exists(html_file_path):
-        print(f"Error: HTML file '{html_file_path}' not found.")
+def parse_amazon_html(html_or_path="amazon.html"):
+    # -------- Read HTML (or use it directly if markup was passed in) --------
+    html_content = read_html(html_or_path)
+    if html_content is None:
+        print(f"Error: HTML file '{html_or_path}' not found.")
         return None, None
 
-    with open(html_file_path, "r", encoding="utf-8") as file:
-        html_content = file.read()
-
-    soup = BeautifulSoup(html_content, "lxml")
+    tree = LexborHTMLParser(html_content)
 
     # -------- PRICE EXTRACTION (kept the same) --------
     price = None
 
     # Locate the element that holds the price information (the 'a-price-whole' class for the whole price)
-    price_whole = soup.find("span", {"class": "a-price-whole"})  # The main price whole part
-    price_fraction = soup.find("span", {"class": "a-price-fraction"})  # The decimal part of the price
-    price_symbol = soup.find("span", {"class": "a-price-symbol"})  # The currency symbol
+    price_whole = tree.css_first("span.a-price-whole")  # The main price whole part
+    price_fraction = tree.css_first("span.a-price-fraction")  # The decimal part of the price
+    price_symbol = tree.css_first("span.a-price-symbol")  # The currency symbol
 
     # If we found the whole part and fraction part of the price
     if price_whole and price_fraction:
         # Safely get symbol text if present
-        symbol_text = price_symbol.get_text().strip() if price_symbol else ""
-        price = symbol_text + price_whole.get_text().strip() + "." + price_fraction.get_text().strip()
+        symbol_text = price_symbol.text().strip() if price_symbol else ""
+        price = symbol_text + price_whole.text().strip() + "." + price_fraction.text().strip()
 
     # Print price or fallback message
     if price:
@@ -355,14 +355,21 @@ def parse_amazon_html(html_file_path="amazon.html"):
     # -------- MODEL NUMBER EXTRACTION (kept the same) --------
     model_number = None
 
-    # Find a <th> whose text contains "Item model number" (case-insensitive, trimmed)
-    th_tag = soup.find(lambda tag: tag.name == "th" and "item model number" in tag.get_text(strip=True).lower())
+    # Fast path: a single Lexbor selector for the <td> after a <th> whose own text contains
+    # "Item model number" (case-insensitive) - the matching runs in C, no Python per-node callback
+    td_tag = tree.css_first('th:lexbor-contains("item model number" i) ~ td')
+
+    if td_tag is None:
+        # Fallback: the label text may be nested inside child elements of the <th>
+        th_tag = next((th for th in tree.css("th") if "item model number" in th.text(strip=True).lower()), None)
+        if th_tag:
+            # Find the next <td> sibling that contains the model number
+            td_tag = th_tag.next
+            while td_tag is not None and td_tag.tag != "td":
+                td_tag = td_tag.next
 
-    if th_tag:
-        # Find the next <td> sibling that contains the model number
-        td_tag = th_tag.find_next_sibling("td")
-        if td_tag:
-            model_number = td_tag.get_text(strip=True)
+    if td_tag:
+        model_number = td_tag.text(strip=True)
 
     # Print model number or fallback message
     if model_number:
@@ -375,204 +382,90 @@ def parse_amazon_html(html_file_path="amazon.html"):
 # -----------------------
 # BESTBUY-specific logic
 # -----------------------
-def parse_bestbuy_html(input_file="bestbuy.html"):
-    # Load HTML file
-    if not os.path.exists(input_file):
-        print(f"Error: HTML file '{input_file}' not found.")
+def parse_bestbuy_html(html_or_path="bestbuy.html"):
+    # Load HTML file (or use it directly if markup was passed in)
+    html = read_html(html_or_path)
+    if html is None:
+        print(f"Error: HTML file '{html_or_path}' not found.")
         return "Price not found", "Model number not found"
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        html = f.read()
-
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(html)
 
     # -------- PRICE EXTRACTION --------
-    price_element = soup.select_one('[data-testid="price-block-customer-price"] span')
+    price_element = tree.css_first('[data-testid="price-block-customer-price"] span')
 
     if price_element:
-        price = price_element.get_text(strip=True)
+        price = price_element.text(strip=True)
     else:
         price = "Price not found"
 
     # -------- MODEL NUMBER EXTRACTION --------
-    model_element = soup.select_one('.disclaimer .inline-block')
+    model_element = tree.css_first('.disclaimer .inline-block')
 
     if model_element:
         # model_element contains text like:  "Model: SM-S938UZBEXAA"
-        model_number = model_element.get_text(strip=True).replace("Model:", "").strip()
+        model_number = model_element.text(strip=True).replace("Model:", "").strip()
     else:
         model_number = "Model number not found"
 
     # Print results
     print("\n--- Extracted Product Data (BestBuy) ---")
-    print(f"File: {input_file}")
+    if html is not html_or_path:
+        print(f"File: {html_or_path}")
     print(f"Price: {price}")
     print(f"Model Number: {model_number}")
     print("--------------------------------\n")
 
     return price, model_number
 
-async def save_bestbuy_htmls(
-    urls,
-    output_dir="outputs",
-    cookies_file="bestbuy_cookies.json",
-    headless=True,
-):
-    """
-    Loop over list of BestBuy URLs, save each page's HTML to output_dir,
-    parse with parse_bestbuy_html and return results list.
-    """
-    os.makedirs(output_dir, exist_ok=True)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless, slow_mo=100)
-
-        # Load existing cookies/session state if available
-        if os.path.exists(cookies_file):
-            print("🍪 Loading existing cookies/session...")
-            context = await browser.new_context(storage_state=cookies_file)
-        else:
-            print("🆕 No cookies found, creating a new session...")
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1366, "height": 768},
-            )
-
-        results = []
-        try:
-            for idx, url in enumerate(urls, start=1):
-                safe_name = sanitize_filename(url)[:120]
-                output_file = os.path.join(output_dir, f"bestbuy_{idx}_{safe_name}.html")
-                page = None
-                try:
-                    page = await context.new_page()
-                    print(f"\n[BestBuy {idx}/{len(urls)}] Navigating to {url} ...")
-
-
-                    try:
-
-                        await page.goto(url, wait_until="load")
-                        await asyncio.sleep(10)  # extra wait to ensure stability
-                    except TimeoutError as te:
-                        print(f"⚠️ 'load' timeout for {url} after 30s. Continuing anyway...")
-                        try:
-                            await page.wait_for_load_state("domcontentloaded", timeout=7000)
-                        except TimeoutError:
-                            pass
-                    
-
-
-
-
-
-
-                    # Wait randomly for page content to settle
-                    await human_delay(3, 6)
-
-                    # 🖱️ Simulate random human-like mouse movement
-                    for _ in range(3):
-                        x = random.randint(200, 800)
-                        y = random.randint(200, 600)
-                        await page.mouse.move(x, y, steps=random.randint(5, 15))
-                        await human_delay(0.3, 1.5)
-
-                    # 🖱️ Random scrolling
-                    for _ in range(2):
-                        scroll_y = random.randint(400, 1000)
-                        await page.mouse.wheel(0, scroll_y)
-                        await human_delay(1, 3)
-
-                    # Extract HTML
-                    html_content = await page.content()
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    print(f"✅ HTML saved to {output_file}")
-
-                    # Parse and collect results (uses your exact parsing logic)
-                    price, model = parse_bestbuy_html(output_file)
-
-                    results.append({"url": url, "file": output_file, "price": price, "model": model, "status": "ok"})
-                    await page.close()
-                except Exception as e:
-                    print(f"❌ Error processing URL {url}: {e}")
-                    try:
-                        if page:
-                            await page.close()
-                    except Exception:
-                        pass
-                    results.append({"url": url, "file": None, "price": None, "model": None, "status": f"error: {e}"})
-
-            # Save cookies/session state after processing all pages
-            storage_state = await context.storage_state()
-            with open(cookies_file, "w", encoding="utf-8") as f:
-                json.dump(storage_state, f, ensure_ascii=False, indent=4)
-            print(f"\n🍪 Cookies/session state written to {cookies_file}")
-
-        finally:
-            await browser.close()
-
-    return results
-
 # -----------------------
 # SAMSUNG-specific logic
 # -----------------------
-async def wait_network_idle(page, timeout=15000):
-    """Wait until network becomes idle (0 active requests)."""
-    try:
-        await page.wait_for_load_state("networkidle", timeout=timeout)
-        await asyncio.sleep(10)  # extra wait to ensure stability | not sure if this is the right approach
-    except TimeoutError:
-        print("⚠️ networkidle timeout — continuing anyway")
-
 def extract_sku_from_url(url: str):
     """Extract SKU value from the given URL (looks for 'sku-<value>' or 'sm-<value>')."""
     if not url:
         return None
     
     # Try to find sku- first
-    m = re.search(r"sku-([A-Za-z0-9-]+)", url, re.IGNORECASE)
+    m = _SKU_RE.search(url)
     if m:
         return m.group(1)
     
     # If not found, try to find sm-
-    m = re.search(r"(sm-[A-Za-z0-9-]+)", url, re.IGNORECASE)
+    m = _SM_RE.search(url)
     if m:
         return m.group(1)
     
     return None
 
 
-def extract_price(filename):
-    """Extract 512GB model price from saved HTML using BeautifulSoup."""
-    if not os.path.exists(filename):
-        print(f"❌ File not found for parsing: {filename}")
+def extract_price(html_or_path):
+    """Extract 512GB model price from page HTML (or a saved HTML file) using selectolax (Lexbor)."""
+    html = read_html(html_or_path)
+    if html is None:
+        print(f"❌ File not found for parsing: {html_or_path}")
         return None
 
-    with open(filename, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
+    tree = LexborHTMLParser(html)
 
-    container = soup.find(id="device_info")
+    container = tree.css_first("#device_info")
     if not container:
         print("❌ device_info not found in HTML")
         return None
 
-    radios = container.find_all(attrs={"role": "radio"})
+    radios = container.css('[role="radio"]')
     target = None
 
     # Prefer aria-checked=true
     for r in radios:
-        if r.get("aria-checked") == "true":
+        if r.attributes.get("aria-checked") == "true":
             target = r
             break
 
     # Otherwise find 512GB
     if target is None:
         for r in radios:
-            if "512" in r.get_text():
+            if "512" in r.text():
                 target = r
                 break
 
@@ -581,40 +474,192 @@ def extract_price(filename):
         return None
 
     # Extract price
-    text = target.get_text("\n", strip=True)
-    prices = re.findall(r"\$\s*[\d,]+\.\d{2}", text)
-
-    # Choose price that is NOT a "was:" value
-    selected = None
-    for line in text.split("\n"):
-        if "$" in line and "was" not in line.lower():
-            m = re.search(r"\$\s*[\d,]+\.\d{2}", line)
-            if m:
-                selected = m.group(0)
-                break
+    text = target.text(separator="\n", strip=True, skip_empty=True)
+
+    # Choose price that is NOT a "was:" value; otherwise fall back to the last price found
+    m = _PRICE_NO_WAS_RE.search(text)
+    if m:
+        selected = m.group(1)
+    else:
+        prices = _PRICE_RE.findall(text)
+        selected = prices[-1] if prices else None
+
+    print("🔎 Extracted Price:", selected)
+    return selected
+
+def extract_price_and_sku(html_or_path, url):
+    """Return (price, sku) for a Samsung page: price parsed from the HTML, SKU taken from the URL."""
+    price = extract_price(html_or_path)
+    sku = extract_sku_from_url(url)
+    print("🔎 Final extracted values — Price:", price, "SKU:", sku)
+    return price, sku
+
+# -----------------------
+# Generic site runner
+# -----------------------
+# Everything that differs between the sites; scrape_site() reads it by site name.
+# - cookies: cookies/session file (None -> always a fresh session, never saved)
+# - parse(html, url) -> tuple of values for extra_keys
+# - wait_selector: node the parser needs; waited for on the fast path, page still parsed if it never shows
+#   unless wait_selector_required is set, in which case the timeout fails the URL like any other error
+# - required_selector: if it never shows, the page is saved (not parsed) and recorded with
+#   missing_values(url) and missing_status
+# - simulate_human: in stealth mode, load the full page and move/scroll like a person
+SITE_CONFIG = {
+    "amazon": {
+        "label": "Amazon",
+        "cookies": "amazon_cookies.json",
+        "viewport": {"width": 1366, "height": 768},
+        "filename_maxlen": 120,
+        "parse": lambda html, url: parse_amazon_html(html),
+        "extra_keys": ("price", "model"),
+        "wait_selector": "span.a-price-whole",
+        "wait_selector_required": False,
+        "required_selector": None,
+        "simulate_human": True,
+    },
+    "bestbuy": {
+        "label": "BestBuy",
+        "cookies": "bestbuy_cookies.json",
+        "viewport": {"width": 1366, "height": 768},
+        "filename_maxlen": 120,
+        "parse": lambda html, url: parse_bestbuy_html(html),
+        "extra_keys": ("price", "model"),
+        "wait_selector": '[data-testid="price-block-customer-price"]',
+        "wait_selector_required": False,
+        "required_selector": None,
+        "simulate_human": True,
+    },
+    "samsung": {
+        "label": "Samsung",
+        # Samsung always starts from a fresh session (cookie reuse is disabled for it)
+        "cookies": None,
+        "viewport": {"width": 1600, "height": 900},
+        "filename_maxlen": 200,
+        "parse": extract_price_and_sku,
+        "extra_keys": ("price", "sku"),
+        "wait_selector": "#device_info span",
+        "wait_selector_required": True,
+        # "networkidle" rarely settles on Samsung's pages (constant analytics traffic), so gate on the DOM instead
+        "required_selector": "#device_info",
+        "missing_values": lambda url: (None, extract_sku_from_url(url)),
+        "missing_status": "partial: no device_info",
+        "simulate_human": False,
+    },
+}
+
+async def _scrape_url(name, context, idx, total, url, output_dir, sem, stealth=False):
+    """Open one URL of site `name` in its own page, save its HTML and return the parsed result dict."""
+    cfg = SITE_CONFIG[name]
+    async with sem:
+        safe_name = sanitize_filename(url, cfg["filename_maxlen"])
+        output_file = os.path.join(output_dir, f"{name}_{idx}_{safe_name}.html")
+        page = None
+        try:
+            page = await context.new_page()
+            print(f"\n[{cfg['label']} {idx}/{total}] Navigating to {url} ...")
 
-    print("🔎 Extracted Price:", selected or (prices[-1] if prices else None))
-    return selected or (prices[-1] if prices else None)
+            if stealth and cfg["simulate_human"]:
+                try:
+                    await page.goto(url, wait_until="load")
+                    await asyncio.sleep(10)  # extra wait to ensure dynamic content loads
+                except TimeoutError:
+                    print(f"⚠️ 'load' timeout for {url} after 30s. Continuing anyway...")
+                    try:
+                        await page.wait_for_load_state("domcontentloaded", timeout=7000)
+                    except TimeoutError:
+                        pass
+                await simulate_human(page)
+            else:
+                # Fast path: only wait for the nodes the parser needs
+                await page.goto(url, wait_until="domcontentloaded")
+                required = cfg["required_selector"]
+                if required:
+                    print(f"Waiting for {required} box...")
+                    try:
+                        await page.wait_for_selector(required, state="attached", timeout=20000)
+                    except TimeoutError:
+                        print(f"❌ {required} did NOT load — {cfg['label']} blocked or loaded too slowly.")
+                        # Still save HTML for debugging; there is nothing to parse
+                        await start_html_save(output_file, await page.content())
+                        await page.close()
+                        values = cfg["missing_values"](url)
+                        return {"url": url, "file": output_file, **dict(zip(cfg["extra_keys"], values)), "status": cfg["missing_status"]}
+                if cfg["wait_selector_required"]:
+                    await page.wait_for_selector(cfg["wait_selector"], state="attached", timeout=15000)
+                else:
+                    await wait_for_selector_or_continue(page, cfg["wait_selector"])
+
+            # Extract HTML, save it in the background and parse it from memory meanwhile
+            html_content = await page.content()
+            save_task = start_html_save(output_file, html_content)
+
+            try:
+                # parse and collect results (keeps your parsing logic)
+                values = cfg["parse"](html_content, url)
+            finally:
+                # never leave the write running unobserved, even if the parser raised
+                await save_task
+            print(f"✅ HTML saved to {output_file}")
+
+            await page.close()
+            return {"url": url, "file": output_file, **dict(zip(cfg["extra_keys"], values)), "status": "ok"}
+        except Exception as e:
+            print(f"❌ Error processing URL {url}: {e}")
+            try:
+                if page:
+                    await page.close()
+            except Exception:
+                pass
+            return {"url": url, "file": None, **dict.fromkeys(cfg["extra_keys"]), "status": f"error: {e}"}
 
-async def save_samsung_htmls(
+async def scrape_site(
+    name,
+    context,
     urls,
+    *,
     output_dir="outputs",
-    cookies_file="samsung_cookies.json",
-    headless=True,
+    concurrency=MAX_CONCURRENT_PAGES,
+    stealth=False,
 ):
     """
-    Loop over list of Samsung product URLs, save each page's HTML to output_dir,
-    parse price and sku using the same logic you provided, and return results list.
+    Scrape the URLs of site `name` (a SITE_CONFIG key) concurrently (up to `concurrency` pages) in `context`,
+    save each page's HTML to output_dir, parse it with the site's parser and return the results list.
     """
     os.makedirs(output_dir, exist_ok=True)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless)   # keep visible by default per original
-        # Create or reuse context
-        # if os.path.exists(cookies_file):
-        #     print("🍪 Loading existing cookies/session...")
-        #     context = await browser.new_context(storage_state=cookies_file)
-        # else:
+    sem = asyncio.Semaphore(concurrency)
+    gathered = await asyncio.gather(
+        *[_scrape_url(name, context, idx, len(urls), url, output_dir, sem, stealth) for idx, url in enumerate(urls, start=1)],
+        return_exceptions=True,
+    )
+    extra_keys = SITE_CONFIG[name]["extra_keys"]
+    results = [
+        r if not isinstance(r, BaseException)
+        else {"url": url, "file": None, **dict.fromkeys(extra_keys), "status": f"error: {r}"}
+        for url, r in zip(urls, gathered)
+    ]
+
+    return results
+
+# -----------------------
+# Shared browser
+# -----------------------
+async def _block_unneeded_requests(route):
+    """Abort images/fonts/media/stylesheets and tracker requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_site_context(browser, cookies_file=None, viewport=None):
+    """Create a BrowserContext on the shared browser, reusing saved cookies/session state when available."""
+    # Load existing cookies/session state if available
+    if cookies_file and os.path.exists(cookies_file):
+        print("🍪 Loading existing cookies/session...")
+        context = await browser.new_context(storage_state=cookies_file)
+    else:
         print("🆕 No cookies found, creating a new session...")
         context = await browser.new_context(
             user_agent=(
@@ -622,84 +667,74 @@ async def save_samsung_htmls(
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
             ),
-            viewport={"width": 1600, "height": 900},
+            viewport=viewport or {"width": 1366, "height": 768},
         )
 
-        results = []
-        try:
-            for idx, url in enumerate(urls, start=1):
-                safe_name = sanitize_filename(url)
-                output_file = os.path.join(output_dir, f"samsung_{idx}_{safe_name}.html")
-
-                page = None
-                try:
-                    page = await context.new_page()
-                    print(f"\n[Samsung {idx}/{len(urls)}] Navigating to {url} ...")
-                    await page.goto(url, wait_until="domcontentloaded")
-
-                    print("Waiting for network to be idle...")
-                    await wait_network_idle(page, timeout=20000)
-
-                    print("Waiting for #device_info box...")
-                    try:
-                        await page.wait_for_selector("#device_info", timeout=20000)
-                    except TimeoutError:
-                        print("❌ #device_info did NOT load — Samsung blocked or loaded too slowly.")
-                        # Still save HTML for debugging
-                        html = await page.content()
-                        with open(output_file, "w", encoding="utf-8") as f:
-                            f.write(html)
-                        sku = extract_sku_from_url(url)
-                        results.append({"url": url, "file": output_file, "price": None, "sku": sku, "status": "partial: no device_info"})
-                        await page.close()
-                        continue
-
-                    # Extra wait for prices inside #device_info
-                    await page.wait_for_selector("#device_info span", timeout=15000)
-
-                    # Save HTML
-                    html = await page.content()
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(html)
-                    print(f"✅ HTML saved to {output_file}")
-
-                    # Save cookies/session state after each page optionally (we'll write final at end too)
-                    # storage = await context.storage_state()
-                    # with open(cookies_file, "w", encoding="utf-8") as f:
-                    #     json.dump(storage, f, indent=2)
-
-                    # Parse saved HTML using your exact functions
-                    price = extract_price(output_file)
-                    sku = extract_sku_from_url(url)
+    # Cut page weight: nothing the parsers read comes from these requests
+    await context.route("**/*", _block_unneeded_requests)
+    return context
 
-                    print("🔎 Final extracted values — Price:", price, "SKU:", sku)
-                    results.append({"url": url, "file": output_file, "price": price, "sku": sku, "status": "ok"})
+def _write_cookie_files(states):
+    """
+    Write {cookies_file: storage_state} to disk (compact UTF-8 JSON; the files are only machine-read).
+    A failing file is reported and skipped so the others are still written; returns the paths written.
+    """
+    written = []
+    for path, state in states.items():
+        try:
+            Path(path).write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            print(f"❌ Could not write cookies to {path}: {e}")
+            continue
+        written.append(path)
+    return written
+
+async def persist_contexts(contexts, cookie_paths):
+    """Save cookies/session state of every context that has a cookies file, all in one go at shutdown."""
+    names = [name for name in contexts if cookie_paths.get(name)]
+    fetched = await asyncio.gather(
+        *[contexts[name].storage_state() for name in names],
+        return_exceptions=True,
+    )
+    states = {}
+    for name, res in zip(names, fetched):
+        if isinstance(res, BaseException):
+            print(f"❌ Could not save cookies for {name}: {res}")
+        else:
+            states[cookie_paths[name]] = res
 
-                    # tiny cooperative yield
-                    await human_delay_short()
+    # one thread-offloaded pass writes every file, so the event loop never blocks on disk I/O
+    written = await asyncio.to_thread(_write_cookie_files, states)
+    for path in written:
+        print(f"🍪 Cookies/session state written to {path}")
 
-                    await page.close()
-
-                except Exception as e:
-                    print(f"❌ Error processing URL {url}: {e}")
-                    try:
-                        if page:
-                            await page.close()
-                    except Exception:
-                        pass
-                    results.append({"url": url, "file": None, "price": None, "sku": None, "status": f"error: {e}"})
+async def run_all(site_urls, headless=True, stealth=False):
+    """
+    Launch a single Chromium and run every site's scraper concurrently against it.
+    - site_urls: dict of SITE_CONFIG name -> list of URLs
+    - Each site gets its own BrowserContext, so cookies/sessions stay isolated per site.
+    - Cookies are saved once for all sites after every scraper has finished.
+    - stealth: slow down every browser op and simulate human mouse/scroll activity (off = fast path)
+    Returns one entry per site, in order: its results list, or the exception it raised.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, slow_mo=100 if stealth else 0)
+        contexts = {}
 
-            # Write cookies/session state once more at the end
-            # storage = await context.storage_state()
-            # with open(cookies_file, "w", encoding="utf-8") as f:
-            #     json.dump(storage, f, indent=2)
-            # print(f"\n🍪 Cookies/session state written to {cookies_file}")
+        async def run_site(name, urls):
+            cfg = SITE_CONFIG[name]
+            context = await new_site_context(browser, cfg["cookies"], cfg["viewport"])
+            contexts[name] = context
+            return await scrape_site(name, context, urls, stealth=stealth)
 
+        try:
+            results = await asyncio.gather(*[run_site(name, urls) for name, urls in site_urls.items()], return_exceptions=True)
+            await persist_contexts(contexts, {name: SITE_CONFIG[name]["cookies"] for name in site_urls})
+            return results
         finally:
+            # closing the browser closes every context as well
             await browser.close()
 
-    return results
-
 # -----------------------
 # Combined main
 # -----------------------
@@ -797,49 +832,42 @@ async def main():
 
     ]
 
-    print("\n=== Running Amazon scraper ===")
-    am_res = await save_amazon_htmls(amazon_urls, output_dir="outputs", cookies_file="amazon_cookies.json", headless=True)
-    print("\nAmazon Summary:")
-    for r in am_res:
-        print(r)
-
-    print("\n=== Running BestBuy scraper ===")
-    bb_res = await save_bestbuy_htmls(bestbuy_urls, output_dir="outputs", cookies_file="bestbuy_cookies.json", headless=True)
-    print("\nBestBuy Summary:")
-    for r in bb_res:
-        print(r)
-
-    print("\n=== Running Samsung scraper ===")
-    sam_res = await save_samsung_htmls(samsung_urls, output_dir="outputs", cookies_file="samsung_cookies.json", headless=True)
-    print("\nSamsung Summary:")
-    for r in sam_res:
-        print(r)
+    print("\n=== Running Amazon, BestBuy and Samsung scrapers ===")
+    am_res, bb_res, sam_res = await run_all(
+        {"amazon": amazon_urls, "bestbuy": bestbuy_urls, "samsung": samsung_urls},
+        headless=True,
+        stealth=False,
+    )
+
+    site_results = {"Amazon": am_res, "BestBuy": bb_res, "Samsung": sam_res}
+    for site, res in site_results.items():
+        if isinstance(res, BaseException):
+            print(f"\n❌ {site} scraper failed: {res}")
+            continue
+        print(f"\n{site} Summary:")
+        for r in res:
+            print(r)
+    # a failed site contributes no columns to this run's row
+    am_res, bb_res, sam_res = (
+        [] if isinstance(res, BaseException) else res for res in site_results.values()
+    )
 
     # -----------------------
     # Flatten results into a single dict: keys -> values
     # Keys format: "<site>_<index>_<keyname>" e.g. "amazon_1_url", "bestbuy_2_price"
     # -----------------------
     flat = {}
-    utc_now = datetime.datetime.now(datetime.timezone.utc)
-    est_now = utc_now.astimezone(ZoneInfo("US/Eastern"))
+    # tz-aware "now" straight in Eastern time (no UTC now + astimezone round trip)
+    est_now = datetime.now(ZoneInfo("US/Eastern"))
     #flat["run_timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
     # Format: 05 Dec 2025, 07:25
     flat["run_timestamp"] = est_now.strftime("%d %b %Y, %H:%M")
-    # Amazon
-    for i, item in enumerate(am_res, start=1):
-        for k, v in item.items():
-            flat_key = f"amazon_{i}_{k}"
-            flat[flat_key] = v
-    # BestBuy
-    for i, item in enumerate(bb_res, start=1):
-        for k, v in item.items():
-            flat_key = f"bestbuy_{i}_{k}"
-            flat[flat_key] = v
-    # Samsung
-    for i, item in enumerate(sam_res, start=1):
-        for k, v in item.items():
-            flat_key = f"samsung_{i}_{k}"
-            flat[flat_key] = v
+    flat.update({
+        f"{site}_{i}_{k}": v
+        for site, res in (("amazon", am_res), ("bestbuy", bb_res), ("samsung", sam_res))
+        for i, item in enumerate(res, start=1)
+        for k, v in item.items()
+    })
 
     # Save flattened results to Excel (appends as new row)
     excel_file = os.path.join("outputs", "results.xlsx")